@@ -2,7 +2,7 @@
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PID_FILE="$SCRIPT_DIR/.server.pid"
-DB_FILE="$SCRIPT_DIR/prices.json"
+DB_FILE="$SCRIPT_DIR/prices.jsonl"
 PYTHON_SCRIPT="$SCRIPT_DIR/essence_tracker.py"
 VENV_DIR="$SCRIPT_DIR/venv"
 PORT=9000
@@ -98,7 +98,7 @@ status() {
         echo -e "${GREEN}✓ Server is running (PID: $PID)${NC}"
         echo -e "${GREEN}✓ Access at http://localhost:$PORT${NC}"
         if [ -f "$DB_FILE" ]; then
-            COUNT=$(jq 'length' "$DB_FILE" 2>/dev/null || echo "0")
+            COUNT=$(wc -l < "$DB_FILE" 2>/dev/null || echo "0")
             echo -e "${GREEN}✓ Database entries: $COUNT${NC}"
         fi
         return 0
@@ -5,34 +5,72 @@ Stores data in a flat JSON database and serves a web interface on port 9000
 Supports multiple stations via YAML configuration file
 """
 
+import bisect
+import gzip
 import json
 import os
+import re
 import sys
 import signal
+import shutil
 import atexit
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, render_template_string
+from flask import Flask, request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import logging
 import yaml
 
+# orjson serializes several times faster than stdlib json; fall back
+# gracefully since the launcher script may install only minimal deps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
-DB_FILE = SCRIPT_DIR / "prices.json"
+DB_FILE = SCRIPT_DIR / "prices.jsonl"
+LEGACY_DB_FILE = SCRIPT_DIR / "prices.json"
 CONFIG_FILE = SCRIPT_DIR / "config.yaml"
 
+# Official opendata snapshot of every French station (zipped XML),
+# refreshed every ~10 minutes - one download covers all stations
+OPENDATA_URL = "https://donnees.roulez-eco.fr/opendata/instantane"
+OPENDATA_CACHE = Path("/tmp") / "essence_opendata_instantane.zip"
+
+# SP98 prices look like 1.xxx; compiled once so page scans skip the
+# per-call pattern compile
+PRICE_RE = re.compile(r'1\.[0-9]{2,3}')
+
+# Shared session keeps the TCP/TLS connection alive across requests,
+# with a small pool and bounded retries for transient failures
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
 app = Flask(__name__)
 
 def load_config():
@@ -55,59 +93,202 @@ def load_config():
 CONFIG = load_config()
 PORT = CONFIG.get('server', {}).get('port', 9000)
 STATIONS_CONFIG = CONFIG.get('stations', {})
+# Opt-in durability: force fsync on database writes (off by default,
+# the OS page cache flush is plenty for daily price data)
+FSYNC_WRITES = CONFIG.get('storage', {}).get('fsync', False)
 
 class PriceTracker:
     def __init__(self, db_path):
         self.db_path = db_path
+        # Compacted history lives gzip-compressed next to the append tail;
+        # the redundant station/location strings compress an order of
+        # magnitude, keeping long histories cheap to read back
+        self.snapshot_path = db_path.with_suffix(db_path.suffix + '.gz')
+        self.reload()
+
+    def reload(self):
+        """(Re)load the database and remember the file's mtime"""
         self.data = self.load_db()
-    
+        # Day-level index so overrides don't need to scan the whole list
+        self._index = {
+            (e.get('date', '')[:10], e.get('station'), e.get('postal')): e
+            for e in self.data
+        }
+        # Derived views (grouped chart data, rendered fragments) keyed by
+        # name; cleared whenever the underlying data changes
+        self.view_cache = {}
+        self.db_mtime = self._mtime()
+
+    def _mtime(self):
+        """Current mtime of the DB file, or None if it doesn't exist"""
+        try:
+            return os.stat(self.db_path).st_mtime
+        except OSError:
+            return None
+
+    @staticmethod
+    def _dump_line(entry):
+        """Serialize one entry to a JSONL line (bytes)"""
+        if orjson is not None:
+            return orjson.dumps(entry) + b'\n'
+        return json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n'
+
     def load_db(self):
-        """Load database from JSON file"""
-        if self.db_path.exists():
+        """Load database from the compressed snapshot plus the append tail"""
+        self._line_count = 0
+        if not self.db_path.exists() and not self.snapshot_path.exists():
+            return self._load_legacy()
+
+        # Later lines override earlier ones for the same station-day,
+        # so appends never need to rewrite history; the tail is read
+        # after the snapshot so fresh writes always win
+        entries = {}
+        try:
+            if self.snapshot_path.exists():
+                with gzip.open(self.snapshot_path, 'rb') as f:
+                    self._read_lines(f, entries)
+            if self.db_path.exists():
+                with open(self.db_path, 'rb') as f:
+                    self._read_lines(f, entries)
+        except Exception as e:
+            logger.error(f"Error loading database: {e}")
+            return []
+
+        return sorted(entries.values(), key=lambda x: x['date'])
+
+    def _read_lines(self, f, entries):
+        """Merge JSONL lines from an open file into the entries dict"""
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            self._line_count += 1
             try:
-                with open(self.db_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading database: {e}")
-                return []
-        return []
-    
+                entry = orjson.loads(line) if orjson is not None else json.loads(line)
+            except Exception:
+                logger.warning("Skipping unreadable database line")
+                continue
+            key = (entry.get('station'), entry.get('postal'), entry.get('date', '')[:10])
+            entries[key] = entry
+
+    def _load_legacy(self):
+        """One-time import of the old prices.json array format"""
+        if not LEGACY_DB_FILE.exists():
+            return []
+        try:
+            if orjson is not None:
+                data = orjson.loads(LEGACY_DB_FILE.read_bytes())
+            else:
+                with open(LEGACY_DB_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except Exception as e:
+            logger.error(f"Error importing legacy database: {e}")
+            return []
+
+        data.sort(key=lambda x: x['date'])
+        try:
+            with open(self.db_path, 'wb', buffering=65536) as f:
+                for entry in data:
+                    f.write(self._dump_line(entry))
+            self._line_count = len(data)
+            logger.info(f"Migrated {len(data)} entries from {LEGACY_DB_FILE.name} to {self.db_path.name}")
+        except Exception as e:
+            logger.error(f"Error migrating legacy database: {e}")
+        return data
+
     def save_db(self):
-        """Save database to JSON file"""
+        """Checkpoint live entries into the compressed snapshot and reset
+        the append tail"""
+        tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + '.tmp')
         try:
-            with open(self.db_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                for entry in self.data:
+                    f.write(self._dump_line(entry))
+                if FSYNC_WRITES:
+                    f.flush()
+                    os.fsync(f.fileno())
+            # Atomic on POSIX: a crash mid-write leaves the old file intact
+            os.replace(tmp_path, self.snapshot_path)
+
+            # Truncate the tail only once the snapshot is in place; a crash
+            # in between just leaves duplicate lines the load merges away
+            with open(self.db_path, 'wb') as f:
+                if FSYNC_WRITES:
+                    os.fsync(f.fileno())
+
+            self._line_count = len(self.data)
+            self.db_mtime = self._mtime()
             logger.info(f"Database saved with {len(self.data)} entries")
         except Exception as e:
             logger.error(f"Error saving database: {e}")
+
+    def append_entries(self, entries):
+        """Append entry lines in one write, compacting once stale lines pile up"""
+        if not entries:
+            return
+        try:
+            with open(self.db_path, 'ab', buffering=65536) as f:
+                for entry in entries:
+                    f.write(self._dump_line(entry))
+                if FSYNC_WRITES:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._line_count += len(entries)
+            self.db_mtime = self._mtime()
+        except Exception as e:
+            logger.error(f"Error appending to database: {e}")
+            return
+
+        if self._line_count > 2 * len(self.data):
+            self.compact()
+
+    def compact(self):
+        """Drop overridden lines by rewriting the file from live entries"""
+        logger.info(f"Compacting database: {self._line_count} lines -> {len(self.data)} entries")
+        self.save_db()
     
     def add_price(self, price, postal_code, station_name, fuel_type="SP98"):
         """Add or update price entry"""
+        return self.add_prices([(price, postal_code, station_name, fuel_type)])[0]
+
+    def add_prices(self, price_entries):
+        """Add or update a batch of (price, postal_code, station_name,
+        fuel_type) tuples with a single database write"""
+        if not price_entries:
+            return []
+
         now = datetime.now().isoformat()
         today_str = datetime.now().strftime("%Y-%m-%d")
-        
-        # Remove today's entry for this station if it exists (override)
-        self.data = [
-            e for e in self.data 
-            if not (e['date'].startswith(today_str) and 
-                   e['station'] == station_name and 
-                   e['postal'] == postal_code)
-        ]
-        
-        entry = {
-            "date": now,
-            "price": price,
-            "fuel": fuel_type,
-            "postal": postal_code,
-            "station": station_name,
-            "location": "Courbevoie"  # Can be made dynamic if needed
-        }
-        
-        self.data.append(entry)
-        self.data.sort(key=lambda x: x['date'])
-        self.save_db()
-        logger.info(f"Added price entry: €{price}/L for {station_name} on {now}")
-        return entry
+
+        added = []
+        for price, postal_code, station_name, fuel_type in price_entries:
+            entry = {
+                "date": now,
+                "price": price,
+                "fuel": fuel_type,
+                "postal": postal_code,
+                "station": station_name,
+                "location": "Courbevoie"  # Can be made dynamic if needed
+            }
+
+            key = (today_str, station_name, postal_code)
+            existing = self._index.get(key)
+            if existing is not None:
+                # Today's entry already exists: override it in place,
+                # keeping its slot instead of filtering and re-sorting
+                existing.update(entry)
+                entry = existing
+            else:
+                # self.data stays sorted by date, so insert via bisect
+                bisect.insort(self.data, entry, key=lambda x: x['date'])
+                self._index[key] = entry
+
+            added.append(entry)
+            logger.info(f"Added price entry: €{price}/L for {station_name} on {now}")
+
+        self.view_cache.clear()
+        self.append_entries(added)
+        return added
     
     def get_latest(self):
         """Get latest price entry"""
@@ -117,6 +298,46 @@ class PriceTracker:
         """Get all price history"""
         return self.data
 
+# Shared tracker for the web routes - loaded once, not per request
+TRACKER = PriceTracker(DB_FILE)
+
+def get_tracker():
+    """Return the shared tracker, reloading only if the DB file changed
+    on disk (e.g. a --fetch run wrote new prices)"""
+    if TRACKER._mtime() != TRACKER.db_mtime:
+        logger.info("Database changed on disk, reloading")
+        TRACKER.reload()
+    return TRACKER
+
+# Collect candidate price texts in the browser in one call - pulling each
+# element's .text individually is a ChromeDriver round-trip per element
+PRICE_TEXT_SCAN_JS = """
+return [...document.querySelectorAll('*')]
+    .filter(e => e.childNodes.length === 1 && e.textContent.includes('€'))
+    .slice(0, 20)
+    .map(e => e.textContent.trim());
+"""
+
+def _scan_price_from_elements(driver):
+    """Scan €-labelled page text for a plausible price via injected JS"""
+    try:
+        texts = driver.execute_script(PRICE_TEXT_SCAN_JS) or []
+    except Exception as e:
+        logger.warning(f"Price element scan failed: {e}")
+        return None
+
+    for text in texts:
+        if text and '€' in text:
+            try:
+                # Extract price (e.g., "1.895" from "1.895 €/L")
+                price_str = text.split('€')[0].strip().split()[-1]
+                p = float(price_str)
+                if 1.5 < p < 2.5:
+                    return p
+            except:
+                pass
+    return None
+
 def fetch_price_selenium():
     """Fetch price using Selenium (for JavaScript-heavy site)"""
     logger.info("Starting Selenium browser...")
@@ -134,10 +355,13 @@ def fetch_price_selenium():
         
         driver.get("https://www.prix-carburants.gouv.fr/")
         wait = WebDriverWait(driver, 15)
-        
-        # Wait for page to load and JavaScript to execute
-        time.sleep(4)
-        
+
+        # Wait for the page to be usable instead of a fixed pause
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text']")))
+        except Exception:
+            logger.warning("Landing page search input did not appear in time")
+
         # Find and fill postal code input
         logger.info("Looking for postal code input...")
         postal_input = None
@@ -169,20 +393,19 @@ def fetch_price_selenium():
                 postal_input.clear()
                 postal_input.send_keys(TARGET_POSTAL)
                 logger.info(f"Entered postal code: {TARGET_POSTAL}")
-                time.sleep(2)
-                
-                # Try to trigger search or press Enter
+
+                # Trigger the search, then wait for priced results rather
+                # than sleeping a fixed interval
                 postal_input.send_keys("\n")
-                time.sleep(3)
+                logger.info("Waiting for search results...")
+                try:
+                    wait.until(EC.presence_of_element_located(
+                        (By.XPATH, "//*[contains(text(), '€')]")))
+                except Exception:
+                    logger.warning("No priced results appeared before timeout")
         except Exception as e:
             logger.warning(f"Could not fill postal code: {e}")
-        
-        # Wait for results to load
-        logger.info("Waiting for search results...")
-        time.sleep(3)
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        
+
         # Extract price data
         price = None
         try:
@@ -192,41 +415,26 @@ def fetch_price_selenium():
             if TARGET_STATION in page_source or "RELAIS" in page_source:
                 logger.info(f"Found station reference in page")
                 
-                # Look for price patterns - SP98 prices typically 1.5-2.5
-                # Strategy: Find all numbers that look like prices
-                import re
-                price_pattern = r'1\.[0-9]{2,3}'
-                matches = re.findall(price_pattern, page_source)
-                
-                if matches:
-                    # Get the most common price (likely the correct one for this station)
-                    prices = [float(m) for m in set(matches)]
-                    prices.sort()
-                    
-                    # SP98 is typically more expensive, take higher prices first
-                    for p in reversed(prices):
-                        if 1.5 < p < 2.5:  # Reasonable range for fuel prices
-                            price = p
-                            logger.info(f"Extracted price from page source: €{price}/L")
-                            break
+                # Look for price patterns - SP98 prices typically 1.5-2.5.
+                # Single pass: keep the highest in-range match (SP98 is
+                # usually the dearest) without deduping or sorting
+                for m in PRICE_RE.finditer(page_source):
+                    p = float(m.group())
+                    if 1.5 < p < 2.5 and (price is None or p > price):
+                        price = p
+                if price:
+                    logger.info(f"Extracted price from page source: €{price}/L")
                 
                 # Alternative: Look for elements with price text
                 if not price:
-                    price_elements = driver.find_elements(By.XPATH, "//*[contains(text(), '€')]")
-                    if price_elements:
-                        for elem in price_elements[:10]:  # Check first 10 matches
-                            text = elem.text.strip()
-                            if text and '€' in text:
-                                try:
-                                    # Extract price (e.g., "1.895" from "1.895 €/L")
-                                    price_str = text.split('€')[0].strip().split()[-1]
-                                    p = float(price_str)
-                                    if 1.5 < p < 2.5:
-                                        price = p
-                                        logger.info(f"Extracted price from element: €{price}/L")
-                                        break
-                                except:
-                                    pass
+                    price = _scan_price_from_elements(driver)
+                    if not price:
+                        # Results may lazy-load below the fold; scroll
+                        # once and rescan before giving up
+                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                        price = _scan_price_from_elements(driver)
+                    if price:
+                        logger.info(f"Extracted price from element: €{price}/L")
             else:
                 logger.warning(f"Station not found in page source")
         
@@ -246,13 +454,8 @@ def fetch_price_alternative():
     logger.info("Using alternative fetch method...")
     
     try:
-        # Try direct API if available
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-        
-        # Attempt to access the site
-        response = requests.get("https://www.prix-carburants.gouv.fr/", headers=headers, timeout=10)
+        # Attempt to access the site over the pooled session
+        response = SESSION.get("https://www.prix-carburants.gouv.fr/", timeout=10)
         
         if response.status_code == 200:
             logger.info("Successfully connected to prix-carburants.gouv.fr")
@@ -264,39 +467,200 @@ def fetch_price_alternative():
     
     return None
 
-def fetch_price_for_station(postal_code, station_name):
+# Download state shared by the fetch workers: the snapshot is pulled
+# at most once per run, whatever the number of stations
+_opendata_lock = threading.Lock()
+_opendata_state = {'tried': False, 'path': None}
+
+def _download_opendata():
+    """Download the opendata snapshot once per run, caching it in /tmp"""
+    with _opendata_lock:
+        if _opendata_state['tried']:
+            return _opendata_state['path']
+        _opendata_state['tried'] = True
+
+        try:
+            response = SESSION.get(OPENDATA_URL, timeout=30)
+            response.raise_for_status()
+            OPENDATA_CACHE.write_bytes(response.content)
+            _opendata_state['path'] = OPENDATA_CACHE
+            logger.info(f"Downloaded opendata snapshot ({len(response.content)} bytes)")
+        except Exception as e:
+            logger.warning(f"Opendata download failed: {e}")
+
+        return _opendata_state['path']
+
+def _station_name_tokens(station_name):
+    """Distinctive uppercase tokens from a configured station name"""
+    station_short = station_name.split("|")[0].strip().upper()
+    return [t for t in re.split(r'\W+', station_short)
+            if len(t) >= 4 and t not in ('RELAIS', 'STATION')]
+
+def fetch_price_opendata(postal_code, station_name, fuel_type="SP98"):
+    """Fetch price from the opendata XML feed (no browser involved)"""
+    snapshot = _download_opendata()
+    if snapshot is None:
+        return None
+
+    tokens = _station_name_tokens(station_name)
+    fallback_prices = []
+
+    try:
+        with zipfile.ZipFile(snapshot) as archive:
+            with archive.open(archive.namelist()[0]) as xml_file:
+                # Stream-parse: the national file holds ~10k stations,
+                # so clear each <pdv> once processed to keep memory flat
+                for event, elem in ET.iterparse(xml_file, events=('end',)):
+                    if elem.tag != 'pdv':
+                        continue
+                    if elem.get('cp') == postal_code:
+                        price = None
+                        for prix in elem.iter('prix'):
+                            if prix.get('nom') == fuel_type and prix.get('valeur'):
+                                price = float(prix.get('valeur'))
+                                break
+
+                        if price is not None:
+                            address = ' '.join(
+                                child.text.upper() for child in elem
+                                if child.tag in ('adresse', 'ville') and child.text
+                            )
+                            if any(token in address for token in tokens):
+                                logger.info(f"Opendata price for {station_name}: €{price}/L")
+                                elem.clear()
+                                return price
+                            fallback_prices.append(price)
+                    elem.clear()
+    except Exception as e:
+        logger.warning(f"Error parsing opendata feed: {e}")
+        return None
+
+    # No address match: only trust the feed if the postal code is unambiguous
+    if len(fallback_prices) == 1:
+        logger.info(f"Opendata price for {station_name} (single match in {postal_code}): €{fallback_prices[0]}/L")
+        return fallback_prices[0]
+
+    logger.warning(f"Station '{station_name}' not matched in opendata feed")
+    return None
+
+def fetch_price_for_station(postal_code, station_name, fuel_type="SP98"):
     """Fetch price for a specific station"""
     logger.info(f"Fetching price for {station_name} in {postal_code}")
-    
-    # Try Selenium first (more reliable for JS-heavy sites)
-    price = fetch_price_selenium_station(postal_code, station_name)
-    
+
+    # Try the opendata feed first (one shared download, no browser)
+    price = fetch_price_opendata(postal_code, station_name, fuel_type)
+
+    # Fall back to Selenium scraping of the interactive site
+    if price is None:
+        price = fetch_price_selenium_station(postal_code, station_name)
+
     if price is None:
         logger.warning(f"Could not fetch price for {station_name}")
-    
+
     return price
 
-def fetch_price_selenium_station(postal_code, station_name):
-    """Fetch price using Selenium for a specific station"""
-    logger.info(f"Starting Selenium browser for {station_name}...")
-    
-    chrome_options = Options()
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-    
-    try:
+# Each fetch worker keeps its own long-lived Chrome instance; restart it
+# after this many stations so headless Chrome memory growth stays bounded
+DRIVER_MAX_USES = 8
+
+_driver_local = threading.local()
+_driver_registry = []
+_driver_registry_lock = threading.Lock()
+
+def _get_driver():
+    """Return this thread's WebDriver, starting or recycling it as needed"""
+    driver = getattr(_driver_local, 'driver', None)
+
+    # Recycle after enough uses - restarting is cheaper than leaking
+    if driver is not None and _driver_local.uses >= DRIVER_MAX_USES:
+        logger.info("Restarting Chrome driver after repeated use")
+        _quit_thread_driver()
+        driver = None
+
+    if driver is None:
+        chrome_options = Options()
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--window-size=1920,1080')
+
         driver = webdriver.Chrome(options=chrome_options)
         logger.info("Chrome driver initialized")
-        
+
+        # Load the landing page once; later stations just refill the form
         driver.get("https://www.prix-carburants.gouv.fr/")
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text']")))
+        except Exception:
+            logger.warning("Landing page search input did not appear in time")
+
+        _driver_local.driver = driver
+        _driver_local.uses = 0
+        with _driver_registry_lock:
+            _driver_registry.append(driver)
+
+    _driver_local.uses += 1
+    return driver
+
+def _quit_thread_driver():
+    """Quit this thread's WebDriver (e.g. after an error) if it has one"""
+    driver = getattr(_driver_local, 'driver', None)
+    if driver is None:
+        return
+    _driver_local.driver = None
+    with _driver_registry_lock:
+        if driver in _driver_registry:
+            _driver_registry.remove(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def shutdown_drivers():
+    """Quit every WebDriver started by the fetch workers"""
+    with _driver_registry_lock:
+        drivers = list(_driver_registry)
+        _driver_registry.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+# Find the result card for one station in the browser: CSS has no
+# :contains(), so locate the deepest node with the name and walk up to
+# the enclosing card (a few levels, stopping at a station-ish class)
+STATION_CARD_JS = """
+const name = arguments[0];
+const nodes = [...document.querySelectorAll('*')]
+    .filter(e => e.children.length === 0 && e.textContent.includes(name));
+if (!nodes.length) return null;
+let card = nodes[0];
+for (let i = 0; i < 6 && card.parentElement; i++) {
+    card = card.parentElement;
+    if ((card.className || '').toString().toLowerCase().includes('station')) break;
+}
+return card.outerHTML;
+"""
+
+def _station_card_html(driver, station_short):
+    """outerHTML of the station's own result card, or None if not found"""
+    try:
+        return driver.execute_script(STATION_CARD_JS, station_short)
+    except Exception as e:
+        logger.warning(f"Station card lookup failed: {e}")
+        return None
+
+def fetch_price_selenium_station(postal_code, station_name):
+    """Fetch price using Selenium for a specific station"""
+    logger.info(f"Fetching {station_name} via Selenium...")
+
+    try:
+        driver = _get_driver()
         wait = WebDriverWait(driver, 15)
-        
-        # Wait for page to load and JavaScript to execute
-        time.sleep(4)
-        
+
         # Find and fill postal code input
         logger.info(f"Looking for postal code input...")
         postal_input = None
@@ -308,7 +672,7 @@ def fetch_price_selenium_station(postal_code, station_name):
                 "input[type='text'][id*='postal']",
                 "input[type='text'][id*='commune']",
             ]
-            
+
             for selector in selectors:
                 try:
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
@@ -317,525 +681,304 @@ def fetch_price_selenium_station(postal_code, station_name):
                         break
                 except:
                     pass
-            
+
             # If no specific selector found, try all text inputs
             if not postal_input:
                 text_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='text']")
                 if text_inputs:
                     postal_input = text_inputs[0]
-            
+
             if postal_input:
-                postal_input.clear()
-                postal_input.send_keys(postal_code)
+                # Set the value through JS with an input event so a reused
+                # driver updates its results without reloading the page
+                driver.execute_script(
+                    "arguments[0].value = arguments[1];"
+                    "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+                    postal_input, postal_code)
                 logger.info(f"Entered postal code: {postal_code}")
-                time.sleep(2)
-                
-                # Try to trigger search or press Enter
+
+                # Trigger the search, then wait for priced results rather
+                # than sleeping a fixed interval
                 postal_input.send_keys("\n")
-                time.sleep(3)
+                logger.info("Waiting for search results...")
+                try:
+                    wait.until(EC.presence_of_element_located(
+                        (By.XPATH, "//*[contains(text(), '€')]")))
+                except Exception:
+                    logger.warning("No priced results appeared before timeout")
         except Exception as e:
             logger.warning(f"Could not fill postal code: {e}")
-        
-        # Wait for results to load
-        logger.info("Waiting for search results...")
-        time.sleep(3)
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        
+
         # Extract price data for this specific station
         price = None
         try:
-            page_source = driver.page_source
-            
-            # Look for station in page (use shortened name)
+            # Prefer scanning just the station's result card: other
+            # stations on the page carry 1.xxx prices of their own
             station_short = station_name.split("|")[0].strip()
-            
-            if station_short in page_source or station_name in page_source:
+            page_source = _station_card_html(driver, station_short)
+
+            if page_source is None:
+                # Card not located; fall back to the whole page with the
+                # old naive containment check
+                page_source = driver.page_source
+                if not (station_short in page_source or station_name in page_source):
+                    page_source = None
+
+            if page_source:
                 logger.info(f"Found station reference: {station_name}")
                 
-                # Look for price patterns - SP98 prices typically 1.5-2.5
-                import re
-                price_pattern = r'1\.[0-9]{2,3}'
-                matches = re.findall(price_pattern, page_source)
-                
-                if matches:
-                    prices = [float(m) for m in set(matches)]
-                    prices.sort()
-                    
-                    # SP98 is typically more expensive, take higher prices first
-                    for p in reversed(prices):
-                        if 1.5 < p < 2.5:  # Reasonable range for fuel prices
-                            price = p
-                            logger.info(f"Extracted price for {station_name}: €{price}/L")
-                            break
+                # Look for price patterns - SP98 prices typically 1.5-2.5.
+                # Single pass: keep the highest in-range match (SP98 is
+                # usually the dearest) without deduping or sorting
+                for m in PRICE_RE.finditer(page_source):
+                    p = float(m.group())
+                    if 1.5 < p < 2.5 and (price is None or p > price):
+                        price = p
+                if price:
+                    logger.info(f"Extracted price for {station_name}: €{price}/L")
                 
                 # Alternative: Look for elements with price text
                 if not price:
-                    price_elements = driver.find_elements(By.XPATH, "//*[contains(text(), '€')]")
-                    if price_elements:
-                        for elem in price_elements[:10]:  # Check first 10 matches
-                            text = elem.text.strip()
-                            if text and '€' in text:
-                                try:
-                                    price_str = text.split('€')[0].strip().split()[-1]
-                                    p = float(price_str)
-                                    if 1.5 < p < 2.5:
-                                        price = p
-                                        logger.info(f"Extracted price from element: €{price}/L")
-                                        break
-                                except:
-                                    pass
+                    price = _scan_price_from_elements(driver)
+                    if not price:
+                        # Results may lazy-load below the fold; scroll
+                        # once and rescan before giving up
+                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                        price = _scan_price_from_elements(driver)
+                    if price:
+                        logger.info(f"Extracted price from element: €{price}/L")
             else:
                 logger.warning(f"Station '{station_name}' not found in page source")
-        
+
         except Exception as e:
             logger.warning(f"Error during price extraction: {e}")
-        
-        driver.quit()
+
         return price
-        
+
     except Exception as e:
         logger.warning(f"Selenium error: {e}")
         logger.info("Install ChromeDriver with: brew install chromedriver")
+        # Drop this thread's driver; the next station gets a fresh one
+        _quit_thread_driver()
         return None
 
+# Keep this small: each worker runs its own Chrome, and too many
+# concurrent browsers will exhaust memory before they save any time
+FETCH_WORKERS = 4
+
 def fetch_all_prices():
     """Fetch prices for all configured stations"""
     logger.info("Starting price fetch for all configured stations...")
     tracker = PriceTracker(DB_FILE)
-    
-    total_fetched = 0
+
+    # Flatten config into (postal, name, fuel) jobs so they can be
+    # fetched concurrently - the work is dominated by browser waits
+    jobs = []
     for postal_code, stations in STATIONS_CONFIG.items():
-        logger.info(f"\nFetching prices for postal code {postal_code}...")
-        
         for station_config in stations:
-            station_name = station_config.get('name')
-            fuel_type = station_config.get('fuel', 'SP98')
-            
-            price = fetch_price_for_station(postal_code, station_name)
-            
+            jobs.append((postal_code, station_config.get('name'), station_config.get('fuel', 'SP98')))
+
+    fetched = []
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_price_for_station, postal_code, station_name, fuel_type): (postal_code, station_name, fuel_type)
+            for postal_code, station_name, fuel_type in jobs
+        }
+
+        # Collect results as they finish on the main thread, then store
+        # the whole batch with one database write below
+        for future in as_completed(futures):
+            postal_code, station_name, fuel_type = futures[future]
+            try:
+                price = future.result()
+            except Exception as e:
+                logger.warning(f"Fetch failed for {station_name}: {e}")
+                continue
+
             if price is not None:
-                tracker.add_price(price, postal_code, station_name, fuel_type)
-                total_fetched += 1
+                fetched.append((price, postal_code, station_name, fuel_type))
             else:
                 logger.warning(f"Failed to fetch price for {station_name}")
-    
-    logger.info(f"\n✓ Fetch complete. Updated {total_fetched} station(s)")
+
+    shutdown_drivers()
+    tracker.add_prices(fetched)
+    logger.info(f"\n✓ Fetch complete. Updated {len(fetched)} station(s)")
 
 # Flask routes
 @app.after_request
-def disable_caching(response):
-    """Disable caching for all responses"""
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
+def set_cache_headers(response):
+    """Keep dynamic pages fresh; let the browser cache static assets"""
+    if request.path.startswith('/static/'):
+        response.headers['Cache-Control'] = 'public, max-age=86400'
+    elif request.path == '/chart.json':
+        # Prices change at most a few times a day; a short TTL keeps
+        # repeat views off the serialization path entirely
+        response.headers['Cache-Control'] = 'public, max-age=60'
+    else:
+        response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
+        response.headers['Pragma'] = 'no-cache'
+        response.headers['Expires'] = '0'
     return response
 
-@app.route('/')
-def index():
-    tracker = PriceTracker(DB_FILE)
-    history = tracker.get_history()
-    
-    # Group data by station
-    stations_data = {}
-    for entry in history:
-        station_name = entry.get('station', 'Unknown')
-        if station_name not in stations_data:
-            stations_data[station_name] = []
-        stations_data[station_name].append(entry)
-    
-    # Calculate overall stats
-    if history:
-        latest = history[-1]
-        all_prices = [e['price'] for e in history]
-        min_price = min(all_prices)
-        max_price = max(all_prices)
-    else:
-        latest = None
-        min_price = None
-        max_price = None
-    
-    # Build station checkboxes
-    station_checkboxes = ""
-    for station_name in sorted(stations_data.keys()):
-        station_checkboxes += f'<label style="margin-right: 20px;"><input type="checkbox" class="station-filter" value="{station_name}" checked> {station_name}</label>'
-    
-    # Build table rows for all entries
-    table_rows = ""
-    for e in reversed(history):
-        table_rows += f'<tr class="table-row" data-station="{e.get("station", "Unknown")}"><td><span class="station-label">{e.get("station", "Unknown")}</span></td><td><span class="timestamp">{e["date"]}</span></td><td><span class="price">€{e["price"]:.3f}</span></td><td>{e["fuel"]}</td><td>{e.get("postal", "N/A")}</td></tr>'
-    
-    html = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1">
-        <title>Multi-Station SP98 Price Tracker</title>
-        <script src="https://cdn.jsdelivr.net/npm/chart.js@3.9.1/dist/chart.min.js"></script>
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                padding: 20px;
-            }
-            .container {
-                max-width: 1200px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 10px;
-                box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                overflow: hidden;
-            }
-            header {
-                background: #2c3e50;
-                color: white;
-                padding: 30px;
-                text-align: center;
-            }
-            header h1 { font-size: 28px; margin-bottom: 10px; }
-            header p { opacity: 0.9; font-size: 14px; }
-            .content { padding: 30px; }
-            .controls {
-                background: #f8f9fa;
-                padding: 20px;
-                border-radius: 8px;
-                margin-bottom: 30px;
-                border-left: 4px solid #667eea;
-            }
-            .controls-label {
-                font-weight: 600;
-                color: #2c3e50;
-                margin-bottom: 15px;
-                display: block;
-            }
-            .station-filters {
-                display: flex;
-                flex-wrap: wrap;
-                gap: 20px;
-            }
-            .station-filters label {
-                display: flex;
-                align-items: center;
-                cursor: pointer;
-                user-select: none;
-            }
-            .station-filters input[type="checkbox"] {
-                margin-right: 8px;
-                width: 18px;
-                height: 18px;
-                cursor: pointer;
-            }
-            .refresh-btn {
-                background: #667eea;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                cursor: pointer;
-                font-size: 14px;
-            }
-            .refresh-btn:hover { background: #764ba2; }
-            .stats {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-                gap: 20px;
-                margin-bottom: 30px;
-            }
-            .stat-card {
-                background: #f8f9fa;
-                padding: 20px;
-                border-radius: 8px;
-                border-left: 4px solid #667eea;
-            }
-            .stat-label { font-size: 11px; color: #666; text-transform: uppercase; margin-bottom: 5px; }
-            .stat-value { font-size: 22px; font-weight: bold; color: #2c3e50; }
-            .chart-container {
-                position: relative;
-                height: 400px;
-                background: #f8f9fa;
-                padding: 20px;
-                border-radius: 8px;
-                margin-bottom: 30px;
-            }
-            .table-container {
-                overflow-x: auto;
-            }
-            table {
-                width: 100%;
-                border-collapse: collapse;
-            }
-            th, td {
-                padding: 12px;
-                text-align: left;
-                border-bottom: 1px solid #e0e0e0;
-            }
-            th {
-                background: #f8f9fa;
-                font-weight: 600;
-                color: #2c3e50;
-                cursor: pointer;
-                user-select: none;
-                position: relative;
-            }
-            th:hover {
-                background: #e8eaed;
-            }
-            th.sortable::after {
-                content: ' ⇅';
-                font-size: 12px;
-                opacity: 0.5;
-            }
-            th.sorted-asc::after {
-                content: ' ↑';
-                opacity: 1;
-            }
-            th.sorted-desc::after {
-                content: ' ↓';
-                opacity: 1;
-            }
-            tr:hover { background: #f8f9fa; }
-            tr.hidden { display: none; }
-            .price { font-weight: bold; color: #27ae60; font-size: 16px; }
-            .timestamp { color: #7f8c8d; font-size: 12px; }
-            .station-label { font-weight: 600; color: #2c3e50; }
-            .no-data { text-align: center; color: #7f8c8d; padding: 40px; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <header>
-                <h1>⛽ SP98 Price Tracker</h1>
-                <p>All stations evolution</p>
-            </header>
-            <div class="content">
-                <button class="refresh-btn" onclick="location.reload()">↻ Refresh</button>
-                """ + (f"""
-                <div class="controls">
-                    <span class="controls-label">Filter by Station:</span>
-                    <div class="station-filters">
-                        {station_checkboxes}
-                    </div>
+# Page shell; CSS/JS live under static/ so browsers cache them and each
+# request only renders the dynamic parts
+INDEX_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>Multi-Station SP98 Price Tracker</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js@3.9.1/dist/chart.min.js"></script>
+    <link rel="stylesheet" href="{{ url_for('static', filename='style.css') }}">
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>⛽ SP98 Price Tracker</h1>
+            <p>All stations evolution</p>
+        </header>
+        <div class="content">
+            <button class="refresh-btn" onclick="location.reload()">↻ Refresh</button>
+            {% if history_count %}
+            <div class="controls">
+                <span class="controls-label">Filter by Station:</span>
+                <div class="station-filters">
+                    {{ station_checkboxes|safe }}
                 </div>
-                
-                <div class="stats">
-                    <div class="stat-card">
-                        <div class="stat-label">Current Price</div>
-                        <div class="stat-value">€{latest['price']:.3f}</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-label">Last Updated</div>
-                        <div class="stat-value">{latest['date'].split('T')[0]}</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-label">Total Records</div>
-                        <div class="stat-value">{len(history)}</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-label">Min / Max</div>
-                        <div class="stat-value">€{min_price:.3f} / €{max_price:.3f}</div>
-                    </div>
+            </div>
+
+            <div class="stats">
+                <div class="stat-card">
+                    <div class="stat-label">Current Price</div>
+                    <div class="stat-value">€{{ '%.3f'|format(latest['price']) }}</div>
                 </div>
-                
-                <div class="chart-container">
-                    <canvas id="priceChart"></canvas>
+                <div class="stat-card">
+                    <div class="stat-label">Last Updated</div>
+                    <div class="stat-value">{{ latest['date'].split('T')[0] }}</div>
                 </div>
-                
-                <div class="table-container">
-                    <table id="priceTable">
-                        <thead>
-                            <tr>
-                                <th class="sortable" data-column="station">Station</th>
-                                <th class="sortable" data-column="date">Date</th>
-                                <th class="sortable" data-column="price">Price</th>
-                                <th class="sortable" data-column="fuel">Fuel</th>
-                                <th class="sortable" data-column="postal">Postal</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {table_rows}
-                        </tbody>
-                    </table>
+                <div class="stat-card">
+                    <div class="stat-label">Total Records</div>
+                    <div class="stat-value">{{ history_count }}</div>
                 </div>
-                
-                <script>
-                    const allStationsData = {json.dumps({station: [{"x": e['date'].split('T')[0], "y": e['price']} for e in station_history] for station, station_history in stations_data.items()})};
-                    
-                    const colors = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#43e97b', '#fa709a'];
-                    let chart = null;
-                    
-                    function getSelectedStations() {{
-                        const selected = [];
-                        document.querySelectorAll('.station-filter:checked').forEach(cb => {{
-                            selected.push(cb.value);
-                        }});
-                        return selected;
-                    }}
-                    
-                    function updateChart() {{
-                        const selectedStations = getSelectedStations();
-                        const datasets = [];
-                        
-                        Object.keys(allStationsData).sort().forEach((station, idx) => {{
-                            if (selectedStations.includes(station)) {{
-                                const data = allStationsData[station];
-                                const color = colors[idx % colors.length];
-                                datasets.push({{
-                                    label: station,
-                                    data: data.map(d => d.y),
-                                    borderColor: color,
-                                    backgroundColor: color + '1a',
-                                    borderWidth: 2,
-                                    tension: 0.4,
-                                    fill: false,
-                                    pointBackgroundColor: color,
-                                    pointBorderColor: '#fff',
-                                    pointBorderWidth: 2,
-                                    pointRadius: 5
-                                }});
-                            }}
-                        }});
-                        
-                        if (datasets.length > 0) {{
-                            const allDates = [];
-                            selectedStations.forEach(station => {{
-                                allStationsData[station].forEach(d => {{
-                                    if (!allDates.includes(d.x)) allDates.push(d.x);
-                                }});
-                            }});
-                            allDates.sort();
-                            
-                            if (chart) {{
-                                chart.data.labels = allDates;
-                                chart.data.datasets = datasets;
-                                chart.update();
-                            }} else {{
-                                const ctx = document.getElementById('priceChart').getContext('2d');
-                                chart = new Chart(ctx, {{
-                                    type: 'line',
-                                    data: {{
-                                        labels: allDates,
-                                        datasets: datasets
-                                    }},
-                                    options: {{
-                                        responsive: true,
-                                        maintainAspectRatio: false,
-                                        plugins: {{
-                                            legend: {{
-                                                display: true,
-                                                labels: {{ font: {{ size: 12 }} }}
-                                            }}
-                                        }},
-                                        scales: {{
-                                            y: {{
-                                                beginAtZero: false,
-                                                ticks: {{ callback: d => '€' + d.toFixed(2) }}
-                                            }}
-                                        }}
-                                    }}
-                                }});
-                            }}
-                        }}
-                    }}
-                    
-                    function updateTable() {{
-                        const selectedStations = getSelectedStations();
-                        document.querySelectorAll('.table-row').forEach(row => {{
-                            const station = row.getAttribute('data-station');
-                            if (selectedStations.includes(station)) {{
-                                row.classList.remove('hidden');
-                            }} else {{
-                                row.classList.add('hidden');
-                            }}
-                        }});
-                    }}
-                    
-                    // Add event listeners to checkboxes
-                    document.querySelectorAll('.station-filter').forEach(checkbox => {{
-                        checkbox.addEventListener('change', () => {{
-                            updateChart();
-                            updateTable();
-                        }});
-                    }});
-                    
-                    // Table sorting functionality
-                    let sortColumn = null;
-                    let sortDirection = 'asc';
-                    
-                    function sortTable(column) {{
-                        const table = document.getElementById('priceTable');
-                        const tbody = table.querySelector('tbody');
-                        const rows = Array.from(tbody.querySelectorAll('tr'));
-                        
-                        // Toggle sort direction if same column clicked
-                        if (sortColumn === column) {{
-                            sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
-                        }} else {{
-                            sortDirection = 'asc';
-                            // Remove previous sort indicators
-                            document.querySelectorAll('th.sorted-asc, th.sorted-desc').forEach(th => {{
-                                th.classList.remove('sorted-asc', 'sorted-desc');
-                            }});
-                        }}
-                        sortColumn = column;
-                        
-                        // Sort rows
-                        rows.sort((a, b) => {{
-                            let aVal, bVal;
-                            
-                            if (column === 'price') {{
-                                aVal = parseFloat(a.cells[2].textContent.replace('€', ''));
-                                bVal = parseFloat(b.cells[2].textContent.replace('€', ''));
-                            }} else if (column === 'date') {{
-                                aVal = new Date(a.cells[1].textContent);
-                                bVal = new Date(b.cells[1].textContent);
-                            }} else if (column === 'station') {{
-                                aVal = a.cells[0].textContent.trim();
-                                bVal = b.cells[0].textContent.trim();
-                            }} else if (column === 'fuel') {{
-                                aVal = a.cells[3].textContent.trim();
-                                bVal = b.cells[3].textContent.trim();
-                            }} else if (column === 'postal') {{
-                                aVal = a.cells[4].textContent.trim();
-                                bVal = b.cells[4].textContent.trim();
-                            }}
-                            
-                            if (aVal < bVal) return sortDirection === 'asc' ? -1 : 1;
-                            if (aVal > bVal) return sortDirection === 'asc' ? 1 : -1;
-                            return 0;
-                        }});
-                        
-                        // Re-append sorted rows
-                        rows.forEach(row => tbody.appendChild(row));
-                        
-                        // Update header indicator
-                        const header = document.querySelector(`th[data-column="${{column}}"]`);
-                        header.classList.add(sortDirection === 'asc' ? 'sorted-asc' : 'sorted-desc');
-                    }}
-                    
-                    // Add click listeners to sortable headers
-                    document.querySelectorAll('th.sortable').forEach(th => {{
-                        th.addEventListener('click', () => {{
-                            const column = th.getAttribute('data-column');
-                            sortTable(column);
-                        }});
-                    }});
-                    
-                    // Initialize chart and table
-                    updateChart();
-                    updateTable();
-                </script>
-                """ if history else "<div class='no-data'>No price data yet. Run: ./bf_essence_sp98.sh fetch</div>") + f"""
+                <div class="stat-card">
+                    <div class="stat-label">Min / Max</div>
+                    <div class="stat-value">€{{ '%.3f'|format(min_price) }} / €{{ '%.3f'|format(max_price) }}</div>
+                </div>
+            </div>
+
+            <div class="chart-container">
+                <canvas id="priceChart"></canvas>
+            </div>
+
+            <div class="table-container">
+                <table id="priceTable">
+                    <thead>
+                        <tr>
+                            <th class="sortable" data-column="station">Station</th>
+                            <th class="sortable" data-column="date">Date</th>
+                            <th class="sortable" data-column="price">Price</th>
+                            <th class="sortable" data-column="fuel">Fuel</th>
+                            <th class="sortable" data-column="postal">Postal</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {{ table_rows|safe }}
+                    </tbody>
+                </table>
             </div>
+
+            <script src="{{ url_for('static', filename='app.js') }}"></script>
+            {% else %}
+            <div class='no-data'>No price data yet. Run: ./bf_essence_sp98.sh fetch</div>
+            {% endif %}
         </div>
-    </body>
-    </html>
-    """
-    return render_template_string(html)
+    </div>
+</body>
+</html>
+"""
+
+# Compile the template once at import; rendering reuses the bytecode
+INDEX_TEMPLATE = app.jinja_env.from_string(INDEX_HTML)
+
+def _build_index_context(tracker):
+    """Build the template context for the index page in one history pass"""
+    history = tracker.get_history()
+
+    # One O(N) loop: station names, min/max and table rows
+    station_names = set()
+    table_parts = []
+    min_price = None
+    max_price = None
+    for e in history:
+        station_name = e.get('station', 'Unknown')
+        price = e['price']
+        station_names.add(station_name)
+        if min_price is None or price < min_price:
+            min_price = price
+        if max_price is None or price > max_price:
+            max_price = price
+        table_parts.append(
+            f'<tr class="table-row" data-station="{station_name}"><td><span class="station-label">{station_name}</span></td><td><span class="timestamp">{e["date"]}</span></td><td><span class="price">€{price:.3f}</span></td><td>{e["fuel"]}</td><td>{e.get("postal", "N/A")}</td></tr>')
+
+    # Table shows newest entries first
+    table_parts.reverse()
 
-    return render_template_string(html)
+    station_checkboxes = "".join(
+        f'<label style="margin-right: 20px;"><input type="checkbox" class="station-filter" value="{station_name}" checked> {station_name}</label>'
+        for station_name in sorted(station_names)
+    )
+
+    return {
+        'history_count': len(history),
+        'latest': history[-1] if history else None,
+        'min_price': min_price,
+        'max_price': max_price,
+        'station_checkboxes': station_checkboxes,
+        'table_rows': "".join(table_parts),
+    }
+
+@app.route('/')
+def index():
+    tracker = get_tracker()
+
+    # Cached until the data changes (reload or add_prices clears it)
+    context = tracker.view_cache.get('index')
+    if context is None:
+        context = _build_index_context(tracker)
+        tracker.view_cache['index'] = context
+
+    return INDEX_TEMPLATE.render(**context)
+
+def _build_chart_data(tracker):
+    """Per-station daily series: one chart point per day, latest price wins"""
+    daily = {}
+    for e in tracker.get_history():
+        station_name = e.get('station', 'Unknown')
+        day = e['date'].split('T')[0]
+        daily.setdefault(station_name, {})[day] = e['price']
+
+    return {
+        station_name: [{"x": day, "y": price} for day, price in sorted(days.items())]
+        for station_name, days in daily.items()
+    }
+
+@app.route('/chart.json')
+def chart_json():
+    """Chart series for the dashboard, fetched out of the HTML critical path"""
+    tracker = get_tracker()
+
+    payload = tracker.view_cache.get('chart')
+    if payload is None:
+        chart_data = _build_chart_data(tracker)
+        # One C-level call instead of allocating through many small dicts
+        if orjson is not None:
+            payload = orjson.dumps(chart_data)
+        else:
+            payload = json.dumps(chart_data)
+        tracker.view_cache['chart'] = payload
+
+    return app.response_class(payload, mimetype='application/json')
 
 def main():
     if len(sys.argv) > 1 and sys.argv[1] == '--fetch':
@@ -844,7 +987,7 @@ def main():
         sys.exit(0)
     
     # Server mode
-    tracker = PriceTracker(DB_FILE)
+    tracker = get_tracker()
     logger.info(f"Starting HTTP server on port {PORT}")
     logger.info(f"Database: {DB_FILE}")
     logger.info(f"Config: {CONFIG_FILE}")
@@ -855,7 +998,21 @@ def main():
         logger.info(f"  Postal {postal}: {len(stations)} station(s)")
         for station in stations:
             logger.info(f"    - {station['name']} ({station.get('fuel', 'SP98')})")
-    
+
+    # Prefer gunicorn: the Flask dev server handles one request at a
+    # time, so a slow render would block every other visitor. Threaded
+    # workers each load their own tracker; the mtime check keeps them
+    # in sync after a --fetch run.
+    gunicorn = shutil.which('gunicorn')
+    if gunicorn:
+        logger.info("Starting gunicorn (4 workers x 8 threads)")
+        os.execv(gunicorn, [
+            'gunicorn', '-w', '4', '-k', 'gthread', '--threads', '8',
+            '-b', f'0.0.0.0:{PORT}', '--chdir', str(SCRIPT_DIR),
+            'essence_tracker:app',
+        ])
+
+    logger.warning("gunicorn not found, falling back to the Flask dev server")
     app.run(host='0.0.0.0', port=PORT, debug=False, use_reloader=False)
 
 if __name__ == '__main__':
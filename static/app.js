@@ -0,0 +1,173 @@
+// Dashboard logic for the SP98 price tracker.
+// Chart series are loaded from /chart.json so the page HTML stays small.
+let allStationsData = {};
+
+const colors = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#43e97b', '#fa709a'];
+let chart = null;
+
+function getSelectedStations() {
+    const selected = [];
+    document.querySelectorAll('.station-filter:checked').forEach(cb => {
+        selected.push(cb.value);
+    });
+    return selected;
+}
+
+function updateChart() {
+    const selectedStations = getSelectedStations();
+    const datasets = [];
+
+    Object.keys(allStationsData).sort().forEach((station, idx) => {
+        if (selectedStations.includes(station)) {
+            const data = allStationsData[station];
+            const color = colors[idx % colors.length];
+            datasets.push({
+                label: station,
+                data: data.map(d => d.y),
+                borderColor: color,
+                backgroundColor: color + '1a',
+                borderWidth: 2,
+                tension: 0.4,
+                fill: false,
+                pointBackgroundColor: color,
+                pointBorderColor: '#fff',
+                pointBorderWidth: 2,
+                pointRadius: 5
+            });
+        }
+    });
+
+    if (datasets.length > 0) {
+        const allDates = [];
+        selectedStations.forEach(station => {
+            allStationsData[station].forEach(d => {
+                if (!allDates.includes(d.x)) allDates.push(d.x);
+            });
+        });
+        allDates.sort();
+
+        if (chart) {
+            chart.data.labels = allDates;
+            chart.data.datasets = datasets;
+            chart.update();
+        } else {
+            const ctx = document.getElementById('priceChart').getContext('2d');
+            chart = new Chart(ctx, {
+                type: 'line',
+                data: {
+                    labels: allDates,
+                    datasets: datasets
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        legend: {
+                            display: true,
+                            labels: { font: { size: 12 } }
+                        }
+                    },
+                    scales: {
+                        y: {
+                            beginAtZero: false,
+                            ticks: { callback: d => '€' + d.toFixed(2) }
+                        }
+                    }
+                }
+            });
+        }
+    }
+}
+
+function updateTable() {
+    const selectedStations = getSelectedStations();
+    document.querySelectorAll('.table-row').forEach(row => {
+        const station = row.getAttribute('data-station');
+        if (selectedStations.includes(station)) {
+            row.classList.remove('hidden');
+        } else {
+            row.classList.add('hidden');
+        }
+    });
+}
+
+// Add event listeners to checkboxes
+document.querySelectorAll('.station-filter').forEach(checkbox => {
+    checkbox.addEventListener('change', () => {
+        updateChart();
+        updateTable();
+    });
+});
+
+// Table sorting functionality
+let sortColumn = null;
+let sortDirection = 'asc';
+
+function sortTable(column) {
+    const table = document.getElementById('priceTable');
+    const tbody = table.querySelector('tbody');
+    const rows = Array.from(tbody.querySelectorAll('tr'));
+
+    // Toggle sort direction if same column clicked
+    if (sortColumn === column) {
+        sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
+    } else {
+        sortDirection = 'asc';
+        // Remove previous sort indicators
+        document.querySelectorAll('th.sorted-asc, th.sorted-desc').forEach(th => {
+            th.classList.remove('sorted-asc', 'sorted-desc');
+        });
+    }
+    sortColumn = column;
+
+    // Sort rows
+    rows.sort((a, b) => {
+        let aVal, bVal;
+
+        if (column === 'price') {
+            aVal = parseFloat(a.cells[2].textContent.replace('€', ''));
+            bVal = parseFloat(b.cells[2].textContent.replace('€', ''));
+        } else if (column === 'date') {
+            aVal = new Date(a.cells[1].textContent);
+            bVal = new Date(b.cells[1].textContent);
+        } else if (column === 'station') {
+            aVal = a.cells[0].textContent.trim();
+            bVal = b.cells[0].textContent.trim();
+        } else if (column === 'fuel') {
+            aVal = a.cells[3].textContent.trim();
+            bVal = b.cells[3].textContent.trim();
+        } else if (column === 'postal') {
+            aVal = a.cells[4].textContent.trim();
+            bVal = b.cells[4].textContent.trim();
+        }
+
+        if (aVal < bVal) return sortDirection === 'asc' ? -1 : 1;
+        if (aVal > bVal) return sortDirection === 'asc' ? 1 : -1;
+        return 0;
+    });
+
+    // Re-append sorted rows
+    rows.forEach(row => tbody.appendChild(row));
+
+    // Update header indicator
+    const header = document.querySelector(`th[data-column="${column}"]`);
+    header.classList.add(sortDirection === 'asc' ? 'sorted-asc' : 'sorted-desc');
+}
+
+// Add click listeners to sortable headers
+document.querySelectorAll('th.sortable').forEach(th => {
+    th.addEventListener('click', () => {
+        const column = th.getAttribute('data-column');
+        sortTable(column);
+    });
+});
+
+// Initialize: table is inline in the page, chart data arrives async
+updateTable();
+fetch('/chart.json')
+    .then(response => response.json())
+    .then(data => {
+        allStationsData = data;
+        updateChart();
+    })
+    .catch(err => console.error('Failed to load chart data:', err));